@@ -1,13 +1,16 @@
 from pathlib import Path
 
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 
 
 def main() -> None:
     output_dir = Path(__file__).resolve().parent
     svg_path = output_dir / "float64_value_equation.svg"
 
-    fig, ax = plt.subplots(figsize=(10.5, 2.6))
+    # The output is static and checked in; building the Figure directly skips
+    # pyplot's figure manager and GUI backend setup when it is regenerated
+    fig = Figure(figsize=(10.5, 2.6))
+    ax = fig.subplots()
     ax.axis("off")
 
     lines = [
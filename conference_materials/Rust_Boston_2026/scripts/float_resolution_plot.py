@@ -1,6 +1,12 @@
 from pathlib import Path
+import matplotlib.pyplot as plt
+import matplotlib.ticker as mticker
 import numpy as np
 import plotly.graph_objects as go
+import plotly.io as pio
+
+# Figure JSON for write_html is serialized with orjson
+pio.json.config.default_engine = "orjson"
 
 
 def main() -> None:
@@ -14,62 +20,61 @@ def main() -> None:
             "min_normal": 2.0**-14,
             "min_subnormal": 2.0**-24,
             "max": 65504.0,
-            "dtype": np.float16,
         },
         "f32": {
             "eps": 2.0**-23,
             "min_normal": 2.0**-126,
             "min_subnormal": 2.0**-149,
             "max": 3.4028235e38,
-            "dtype": np.float32,
         },
         "f64": {
             "eps": 2.0**-52,
             "min_normal": 2.0**-1022,
             "min_subnormal": 2.0**-1074,
             "max": 1.7976931348623157e308,
-            "dtype": np.float64,
         },
     }
 
+    # Styling shared by the Plotly (HTML) and matplotlib (SVG) figures
     line_color = "#3b76c4"
+    line_width = 3
+    marker_size = 11
     marker_symbols = ["circle-open", "square-open", "diamond-open"]
+    mpl_marker_symbols = ["o", "s", "D"]
 
+    # Plotly figure for the interactive HTML; the static SVG is drawn with
+    # matplotlib so that export does not have to start a Kaleido subprocess
     fig = go.Figure()
+    mpl_fig, ax = plt.subplots(figsize=(7.0, 4.2))
+    # Pin the x-limits before anything is drawn; autoscale margins would pad past the f64 max
+    ax.set_xscale("log")
+    ax.set_xlim(float_specs["f64"]["min_subnormal"], float_specs["f64"]["max"])
     for idx, (label, spec) in enumerate(float_specs.items()):
         eps = spec["eps"]
         min_normal = spec["min_normal"]
         min_subnormal = spec["min_subnormal"]
         max_value = spec["max"]
-        dtype = spec["dtype"]
-        subnormal_x = np.logspace(
-            np.log10(min_subnormal), np.log10(min_normal), 1200
-        )
-        normal_x = np.logspace(
-            np.log10(min_normal), np.log10(max_value), 240
-        )
+        # geomspace pins the endpoints exactly, so the f64 grid ends at max rather than inf.
+        # Its intermediate power still overflows there before the endpoint is replaced.
+        subnormal_x = np.geomspace(min_subnormal, min_normal, 60)
+        with np.errstate(over="ignore"):
+            normal_x = np.geomspace(min_normal, max_value, 240)
         x = np.concatenate([subnormal_x[:-1], normal_x])
         normal_bits = -np.log2(eps)
         bits = np.full_like(x, normal_bits)
-        subnormal_mask = (x < min_normal) & (x >= min_subnormal)
-        subnormal_x_vals = x[subnormal_mask].astype(dtype, copy=False)
-        min_subnormal_val = np.array(min_subnormal, dtype=dtype)
-        subnormal_x_vals = np.maximum(subnormal_x_vals, min_subnormal_val)
-        with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
-            next_up = np.nextafter(subnormal_x_vals, np.array(np.inf, dtype=dtype))
-            next_down = np.nextafter(subnormal_x_vals, np.array(-np.inf, dtype=dtype))
-            delta_up = (next_up - subnormal_x_vals).astype(np.float64, copy=False)
-            delta_down = (subnormal_x_vals - next_down).astype(np.float64, copy=False)
-            local_resolution = np.maximum(delta_up, delta_down)
-        bits[subnormal_mask] = -np.log2(local_resolution / subnormal_x_vals)
-        bits[x <= float(min_subnormal)] = 0.0
-        bits[~np.isfinite(bits)] = 0.0
+        # Subnormals are evenly spaced min_subnormal apart, so their relative
+        # resolution follows directly from the magnitude
+        subnormal_mask = x < min_normal
+        bits[subnormal_mask] = np.log2(x[subnormal_mask] / min_subnormal).clip(0.0, normal_bits)
+        # Only the transitions matter for a staircase; keep the last point to close it out
+        change = np.concatenate(([True], bits[1:] != bits[:-1]))
+        change[-1] = True
         fig.add_trace(
-            go.Scatter(
-                x=x,
-                y=bits,
+            go.Scattergl(
+                x=x[change],
+                y=bits[change],
                 mode="lines",
-                line=dict(color=line_color, width=3, shape="hv"),
+                line=dict(color=line_color, width=line_width, shape="hv"),
                 name=label,
                 showlegend=False,
             )
@@ -88,16 +93,29 @@ def main() -> None:
                 x=x[marker_indices],
                 y=bits[marker_indices],
                 mode="markers",
-                marker=dict(symbol=marker_symbols[idx], size=11, color=line_color),
+                marker=dict(symbol=marker_symbols[idx], size=marker_size, color=line_color),
                 name=label,
                 hoverinfo="skip",
             )
         )
-        ay = -30 + idx * 20
+        ax.step(x[change], bits[change], where="post", color=line_color, linewidth=line_width)
+        ax.plot(
+            x[marker_indices],
+            bits[marker_indices],
+            linestyle="none",
+            marker=mpl_marker_symbols[idx],
+            markersize=marker_size,
+            markerfacecolor="none",
+            color=line_color,
+            label=label,
+        )
+        # Epsilon label offset from its arrow tip, with +y pointing up the page
+        label_dx = 40
+        label_dy = 30 - idx * 20
         if label == "f32":
-            ay -= 10
+            label_dy += 10
         elif label == "f64":
-            ay += 10
+            label_dy -= 10
         fig.add_annotation(
             x=1.0,
             y=normal_bits,
@@ -105,8 +123,17 @@ def main() -> None:
             showarrow=True,
             arrowcolor="black",
             font=dict(color="black"),
-            ax=40,
-            ay=ay,
+            ax=label_dx,
+            ay=-label_dy,  # Plotly measures annotation offsets downward
+        )
+        ax.annotate(
+            f"epsilon ≈ {eps:.2e}",
+            xy=(1.0, normal_bits),
+            xytext=(label_dx, label_dy),
+            textcoords="offset points",
+            arrowprops=dict(arrowstyle="->", color="black"),
+            ha="center",
+            va="center",
         )
 
     fig.update_xaxes(
@@ -150,7 +177,18 @@ def main() -> None:
         ),
     )
 
-    fig.write_image(str(svg_path))
+    # Fixed decades; automatic log ticks overflow computing decades past the f64 max
+    ax.set_xticks(10.0 ** np.arange(-300, 301, 100))
+    ax.xaxis.set_minor_locator(mticker.NullLocator())
+    ax.xaxis.set_major_formatter(mticker.FormatStrFormatter("%.1e"))
+    ax.yaxis.set_major_formatter(mticker.FormatStrFormatter("%.1f"))
+    ax.set_xlabel("Magnitude")
+    ax.set_ylabel("Resolution (bits)")
+    ax.set_title("Relative Resolution of IEEE-754 Floats")
+    ax.legend(loc="lower right", ncol=len(float_specs), frameon=False)
+    mpl_fig.tight_layout()
+    mpl_fig.savefig(svg_path, format="svg", transparent=True)
+
     fig.write_html(str(html_path), include_plotlyjs="cdn")
 
 
@@ -2,6 +2,11 @@ from pathlib import Path
 
 import numpy as np
 import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.colors import sample_colorscale
+
+# Figure JSON (for write_html and the Kaleido export) is serialized with orjson
+pio.json.config.default_engine = "orjson"
 
 
 def main() -> None:
@@ -9,47 +14,41 @@ def main() -> None:
     svg_path = output_dir / "lagrange_multipliers.svg"
     html_path = output_dir / "lagrange_multipliers.html"
 
-    x = np.linspace(-0.5, 2.0, 300)
-    y = np.linspace(-0.5, 2.0, 300)
-    xx, yy = np.meshgrid(x, y)
-
     dark = "rgb(34, 34, 34)"
     light = "rgb(241, 241, 241)"
     blue = "#3b76c4"
 
     # Objective: f(x, y) = x^2 + 2y^2 with constraint y = 1 - x + 0.6(x - 2/3)^2.
-    zz = xx**2 + 2.0 * yy**2
+    # Its level sets are ellipses, so the contours are drawn analytically
+    # rather than traced from a meshgrid.
 
-    constraint_x = np.linspace(-0.2, 1.6, 300)
+    constraint_x = np.linspace(-0.2, 1.6, 80)
     constraint_y = 1.0 - constraint_x + 0.6 * (constraint_x - (2.0 / 3.0)) ** 2
 
     optimal_x = 2.0 / 3.0
     optimal_y = 1.0 / 3.0
     optimal_value = optimal_x**2 + 2.0 * optimal_y**2
-    max_value = float(np.max(zz))
+    max_value = 2.0**2 + 2.0 * 2.0**2  # Objective at the far corner of the plot range
+
+    levels = np.linspace(optimal_value, max_value, 6)
+    # Colorscale positions k/6 reproduce the band shades go.Contour used for these levels
+    fill_colors = sample_colorscale([[0.0, dark], [1.0, light]], np.arange(6) / 6.0)
+    t = np.linspace(0.0, 2.0 * np.pi, 200)
 
     fig = go.Figure()
-    fig.add_trace(
-        go.Contour(
-            x=x,
-            y=y,
-            z=zz,
-            contours=dict(
-                showlabels=False,
-                coloring="fill",
-                start=optimal_value,
-                end=max_value,
-                size=(max_value - optimal_value) / 5.0,
-            ),
-            colorscale=[
-                [0.0, dark],
-                [1.0, light],
-            ],
-            line=dict(color=blue, width=1),
-            showscale=False,
-            hoverinfo="skip",
+    # Largest first, so each smaller (darker) ellipse is filled on top of the last
+    for level, fill_color in zip(levels[::-1], fill_colors[::-1]):
+        fig.add_trace(
+            go.Scatter(
+                x=np.sqrt(level) * np.cos(t),
+                y=np.sqrt(level / 2.0) * np.sin(t),
+                mode="lines",
+                fill="toself",
+                fillcolor=fill_color,
+                line=dict(color=blue, width=1),
+                hoverinfo="skip",
+            )
         )
-    )
     fig.add_trace(
         go.Scatter(
             x=constraint_x,
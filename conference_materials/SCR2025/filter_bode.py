@@ -3,17 +3,23 @@ import matplotlib.pyplot as plt
 from scipy import signal
 
 
+# Shared frequency grid for every response in this script
+W = np.logspace(1, 6, 500)  # [rad/s]
+
+
 def rc_bode(r, c, w=None):
-    """LTI system and frequency response for first-order analog RC filter"""
+    """Transfer function coefficients and frequency response for first-order analog RC filter"""
 
     # Transfer function: H(s) = 1 / (RCs + 1)
     num = [1]
     den = [r * c, 1]
-    system = signal.TransferFunction(num, den)
+    system = (num, den)
 
-    # Frequency response
-    w = w if w is not None else np.logspace(1, 6, 500)  # [rad/s]
-    w, mag, phase = signal.bode(system, w)
+    # Frequency response, evaluated directly at s = jw
+    w = w if w is not None else W  # [rad/s]
+    h = 1.0 / (r * c * 1j * w + 1.0)
+    mag = 20.0 * np.log10(np.abs(h))  # [dB]
+    phase = np.rad2deg(np.angle(h))  # [deg]
 
     return system, w, mag, phase
 
@@ -25,8 +31,10 @@ def butter_bode(cutoff_ratio, order, fs, w=None):
     system = signal.butter(order, Wn=cutoff_ratio * fs, analog=False, fs=fs)
 
     # Frequency response
-    w = w if w is not None else np.logspace(1, 6, 500)  # [rad/s]
-    w, mag, phase = signal.dbode(signal.dlti(*system, dt=1.0 / fs), w=w / fs)
+    w = w if w is not None else W  # [rad/s]
+    _, h = signal.freqz(*system, worN=w / fs)
+    mag = 20.0 * np.log10(np.abs(h))  # [dB]
+    phase = np.rad2deg(np.unwrap(np.angle(h)))  # [deg]
 
     return system, w, mag, phase
 
@@ -55,19 +63,20 @@ rc_cutoff = 1 / (2.0 * np.pi * r * c)  # [Hz]
 butter_cutoff_ratio = reporting_rate / internal_samplerate
 
 # RC filter freq response
-rc_sys, rc_w, rc_mag, rc_phase = rc_bode(r, c)
+rc_sys, rc_w, rc_mag, rc_phase = rc_bode(r, c, w=W)
 
 # Butterworth filter freq response
 # Examined only below the internal samplerate
-inds = np.where(rc_w < internal_samplerate * 2.0 * np.pi)
-w = rc_w[inds]
+#   rc_w is sorted, so the cutoff is a binary search and the slices below are views
+cut = np.searchsorted(rc_w, internal_samplerate * 2.0 * np.pi)
+w = rc_w[:cut]
 butter_sys, butter_w, butter_mag, butter_phase = butter_bode(
     butter_cutoff_ratio, order=2, fs=internal_samplerate, w=w
 )
 
 # Total freq response
-total_mag = db(inv_db(rc_mag[inds]) * inv_db(butter_mag))  # [dB]
-total_phase = rc_phase[inds] + butter_phase  # [deg]
+total_mag = db(inv_db(rc_mag[:cut]) * inv_db(butter_mag))  # [dB]
+total_phase = rc_phase[:cut] + butter_phase  # [deg]
 
 # Magnitude
 plt.figure(figsize=(12, 8))
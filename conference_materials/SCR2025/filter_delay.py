@@ -1,7 +1,7 @@
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from numpy.typing import NDArray
 import matplotlib.pyplot as plt
-from scipy import signal
 
 
 # Timing components
@@ -26,27 +26,26 @@ groups = [
     [7]
 ]
 
-delays = np.zeros(20)  # [s] delay of each channel
-for i, group in enumerate(groups):
-    delays[group] = i * delay_per_group
+#   Index of the group each channel is sampled in (the inverse of `groups`)
+channel_to_group = np.array([0, 1, 2, 3, 4, 5, 6, 7, 0, 0, 1, 2, 1, 2, 3, 3, 4, 4, 5, 6])
+
+delays = channel_to_group * delay_per_group  # [s] delay of each channel
 
 
 # Build fractional-delay filters for each channel
 
-def poly_taps(order: int, delay: float) -> NDArray:
+def poly_taps(order: int, delay: float | NDArray) -> NDArray:
+    """Lagrange fractional-delay taps; an array of delays gives one row of taps per delay"""
+
+    k = np.arange(order, dtype=np.float64)[:, None]  # tap index
+    m = np.arange(order, dtype=np.float64)[None, :]  # product index
+    mask = k != m
+    den = np.where(mask, k - m, 1.0)
 
-    taps = np.zeros(order)
+    delay = np.asarray(delay, dtype=np.float64)[..., None, None]
+    ratios = np.where(mask, (delay - m) / den, 1.0)
 
-    for k in range(order):
-        coeff = 1.0
-        kv = float(k)
-        for m in range(order):
-            mv = float(m)
-            if m != k:
-                coeff *= (delay - mv) / (kv - mv)
-        taps[k] = coeff
-    
-    return taps
+    return np.prod(ratios, axis=-1)
 
 
 # NOTE: We can apply the delay at either the full or decimated frequency
@@ -55,45 +54,55 @@ sample_period = 1.0 / samplerate  # [s]
 reporting_rate = 1e3  # [Hz]
 fractional_delays = delays / sample_period  # [dimensionless] 
 
+#   Frequency grid shared by every filter order
+w = 2.0 * np.pi * samplerate * np.logspace(-4, np.log10(0.5), 1000)  # [rad/s]
+w_rel = w / samplerate  # [rad/sample]
+freqs_hz = w / (2.0 * np.pi)  # [Hz]
+
+#   One figure is reused for every order; its axes are cleared and redrawn each pass
+fig, (ax1, ax2, ax3, ax4) = plt.subplots(4, 1, figsize=(6, 8))
+
 for order in [3, 4, 5, 6]:
 
-    taps = [poly_taps(order, delay) for delay in fractional_delays]
+    for ax in (ax1, ax2, ax3, ax4):
+        ax.cla()
+
+    taps = poly_taps(order, fractional_delays)  # [dimensionless] one row of taps per channel
 
     #
     # Frequency response
     #
-    w = 2.0 * np.pi * samplerate * np.logspace(-4, np.log10(0.5), 1000)
-    responses = []
-    for b in taps:
-        _, h = signal.freqz(b, worN=w, fs=2.0 * np.pi * samplerate)
-        mag = 20.0 * np.log10(np.abs(h))  # [dB] frequency response magnitude
-        phase = np.unwrap(np.angle(h, deg=True))  # [deg] phase lag frequency response
-        responses.append((mag, phase))
-
-    fig, (ax1, ax2, ax3, ax4) = plt.subplots(4, 1, figsize=(6, 8))
+    #   Evaluate every channel's FIR polynomial at once, H = sum_k b[k] exp(-j w_rel k),
+    #   which is what signal.freqz does for a single set of taps
+    basis = np.exp(-1j * np.outer(np.arange(order), w_rel))
+    h = taps @ basis
+    mag = 20.0 * np.log10(np.abs(h))  # [dB] frequency response magnitude
+    phase = np.unwrap(np.angle(h, deg=True), axis=1)  # [deg] phase lag frequency response
+
     plt.suptitle(f"Per-Channel Fractional Delays\nPoly Order = {order - 1} ({order}-Tap), Samplerate = {samplerate * 1e-3:.2f} kHz")
-    for mag, phase in responses:
-        plt.sca(ax1)
-        plt.semilogx(
-            w / (2.0 * np.pi),
-            mag,
-            color="k",
-            alpha=0.4,
-            linestyle="-",
-        )
-        plt.xlabel("Frequency [Hz]")
-        plt.ylabel("Magnitude [dB]")
-
-        plt.sca(ax2)
-        plt.semilogx(
-            w / (2.0 * np.pi),
-            phase,
-            color="k",
-            alpha=0.4,
-            linestyle="-",
-        )
-        plt.xlabel("Frequency [Hz]")
-        plt.ylabel("Phase [deg]")
+
+    #   One call per axis draws every channel, since each row of mag/phase is a line
+    plt.sca(ax1)
+    plt.semilogx(
+        freqs_hz,
+        mag.T,
+        color="k",
+        alpha=0.4,
+        linestyle="-",
+    )
+    plt.xlabel("Frequency [Hz]")
+    plt.ylabel("Magnitude [dB]")
+
+    plt.sca(ax2)
+    plt.semilogx(
+        freqs_hz,
+        phase.T,
+        color="k",
+        alpha=0.4,
+        linestyle="-",
+    )
+    plt.xlabel("Frequency [Hz]")
+    plt.ylabel("Phase [deg]")
 
     plt.sca(ax1)
     plt.axvline(samplerate / 2, color='k', linewidth=1, label="Nyquist of Samplerate")
@@ -120,17 +129,18 @@ for order in [3, 4, 5, 6]:
         #   Target sample times
         sample_t = np.arange(0.0, 9.0 * sample_period, sample_period)
 
-        #   Actual samples from each group
-        for i in range(len(groups)):
-            delay = -delay_per_group * i
-            group_sample_time = sample_t - delay
-            group_sample_values = func(group_sample_time)
-            label = "Group Samples" if i ==0 else None
-            plt.scatter(group_sample_time * 1e6, group_sample_values, color='k', alpha=1.0, marker="|", s=100, label=label)
-
-            corrected_samples = np.convolve(taps[i], group_sample_values, mode="valid")
-            label = "Corrected Group Samples" if i ==0 else None
-            plt.scatter([sample_t[order-1:] * 1e6], corrected_samples, color='r', alpha=1.0, marker="_", s=500, label=label)
+        #   Actual samples from each group, one row per group
+        group_sample_time = sample_t + delay_per_group * np.arange(len(groups))[:, None]
+        group_sample_values = func(group_sample_time)
+        plt.scatter(group_sample_time * 1e6, group_sample_values, color='k', alpha=1.0, marker="|", s=100, label="Group Samples")
+
+        #   np.convolve(taps[i], group_sample_values[i], mode="valid") for every group at once,
+        #   as the reversed taps dotted with each sliding window of samples.
+        #   Channel i is sampled in group i for the first len(groups) channels.
+        windows = sliding_window_view(group_sample_values, order, axis=1)
+        corrected_samples = np.einsum("gk,gjk->gj", taps[:len(groups), ::-1], windows)
+        corrected_sample_time = np.broadcast_to(sample_t[order-1:], corrected_samples.shape)
+        plt.scatter(corrected_sample_time * 1e6, corrected_samples, color='r', alpha=1.0, marker="_", s=500, label="Corrected Group Samples")
 
         #   Corrected sample values applied to target sample time
         plt.scatter(sample_t * 1e6, func(sample_t), color='r', marker="|", s=500, label="Target Sample Time")